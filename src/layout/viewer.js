@@ -11,6 +11,7 @@ let proteinComponent = null;
 let ligandComponent = null;
 let pocketRepresentation = null;
 let interactionRepresentations = [];
+let overlayElement = null;
 
 /**
  * Initialize NGL stage
@@ -19,6 +20,8 @@ export function initViewer() {
     const container = document.getElementById('ngl-viewport');
     if (!container) return;
 
+    overlayElement = document.getElementById('viewer-overlay');
+
     // Create NGL Stage
     stage = new NGL.Stage(container, {
         backgroundColor: '#0a0a0f',
@@ -249,12 +252,11 @@ export function clearViewer() {
  */
 function updateViewer(state) {
     // Handle viewer overlay for screening
-    const overlay = document.getElementById('viewer-overlay');
-    if (overlay) {
+    if (overlayElement) {
         if (state.isScreeningActive) {
-            overlay.classList.remove('hidden');
+            overlayElement.classList.remove('hidden');
         } else {
-            overlay.classList.add('hidden');
+            overlayElement.classList.add('hidden');
         }
     }
 }
@@ -7,6 +7,10 @@ import { getState, setState, setStatusMessage } from '../state.js';
 import { displayLigand } from '../layout/viewer.js';
 import { refreshSection } from '../layout/section-panel.js';
 
+// Residue pools for mock interactions
+const H_BOND_RESIDUES = ['SER', 'THR', 'TYR', 'ASN', 'GLN'];
+const CONTACT_RESIDUES = ['VAL', 'LEU', 'ILE', 'PHE', 'ALA', 'MET'];
+
 /**
  * Render HITS section
  */
@@ -171,7 +175,7 @@ function generateMockInteractions() {
     const hBondCount = Math.floor(Math.random() * 4) + 2;
     for (let i = 0; i < hBondCount; i++) {
         hBonds.push({
-            residue: ['SER', 'THR', 'TYR', 'ASN', 'GLN'][Math.floor(Math.random() * 5)] + Math.floor(Math.random() * 200 + 50),
+            residue: H_BOND_RESIDUES[Math.floor(Math.random() * H_BOND_RESIDUES.length)] + Math.floor(Math.random() * 200 + 50),
             chain: 'A',
             distance: (Math.random() * 0.8 + 2.5).toFixed(2),
             type: Math.random() > 0.5 ? 'donor' : 'acceptor'
@@ -182,7 +186,7 @@ function generateMockInteractions() {
     const contactCount = Math.floor(Math.random() * 6) + 3;
     for (let i = 0; i < contactCount; i++) {
         contacts.push({
-            residue: ['VAL', 'LEU', 'ILE', 'PHE', 'ALA', 'MET'][Math.floor(Math.random() * 6)] + Math.floor(Math.random() * 200 + 50),
+            residue: CONTACT_RESIDUES[Math.floor(Math.random() * CONTACT_RESIDUES.length)] + Math.floor(Math.random() * 200 + 50),
             chain: 'A',
             distance: (Math.random() * 1.5 + 3.0).toFixed(2)
         });
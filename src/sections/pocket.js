@@ -7,6 +7,13 @@ import { getState, setState, setStatusMessage } from '../state.js';
 import { highlightPocket } from '../layout/viewer.js';
 import { refreshSection } from '../layout/section-panel.js';
 
+// Detected pockets keyed by target structure hash; P2Rank output is
+// deterministic for a given structure, so a reloaded target reuses it
+const pocketCache = new Map();
+
+// Residue pool for mock pocket linings
+const POCKET_RESIDUES = ['ALA', 'VAL', 'LEU', 'ILE', 'PHE', 'TYR', 'TRP'];
+
 /**
  * Render POCKET section
  */
@@ -102,6 +109,19 @@ function attachPocketHandlers(container) {
  * Handle pocket detection (stub)
  */
 async function handleDetectPockets() {
+    const { target } = getState();
+    const cachedPockets = pocketCache.get(target?.structureHash);
+
+    if (cachedPockets) {
+        setState({
+            pockets: cachedPockets,
+            statusMessage: `Reused ${cachedPockets.length} cached binding pockets`
+        });
+
+        refreshSection();
+        return;
+    }
+
     setStatusMessage('Detecting binding pockets via P2Rank...');
 
     // Simulate pocket detection
@@ -132,6 +152,10 @@ async function handleDetectPockets() {
         }
     ];
 
+    if (target?.structureHash) {
+        pocketCache.set(target.structureHash, mockPockets);
+    }
+
     setState({
         pockets: mockPockets,
         statusMessage: `Detected ${mockPockets.length} binding pockets`
@@ -175,7 +199,7 @@ function generateMockResidues(count) {
         residues.push({
             resno: baseResno + i * 2,
             chainname: 'A',
-            resname: ['ALA', 'VAL', 'LEU', 'ILE', 'PHE', 'TYR', 'TRP'][Math.floor(Math.random() * 7)]
+            resname: POCKET_RESIDUES[Math.floor(Math.random() * POCKET_RESIDUES.length)]
         });
     }
 
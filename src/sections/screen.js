@@ -4,11 +4,13 @@
  */
 
 import { getState, setState, setStatusMessage } from '../state.js';
-import { refreshSection } from '../layout/section-panel.js';
 
 let selectedScale = '10000';
 let screeningInterval = null;
 
+// Confidence distribution for mock hits
+const HIT_CONFIDENCES = ['High', 'High', 'Medium', 'Medium', 'Low'];
+
 /**
  * Render SCREEN section
  */
@@ -137,9 +139,8 @@ function handleStartScreening() {
         statusMessage: 'Screening started...'
     });
 
-    refreshSection();
-
-    // Simulate screening progress
+    // Simulate screening progress; each tick is pushed to the panel,
+    // status bar and viewer through the state subscription
     let processed = 0;
     let workers = 1;
     const batchSize = Math.ceil(total / 20);
@@ -162,8 +163,6 @@ function handleStartScreening() {
             statusMessage: `Screening: ${Math.round((processed / total) * 100)}%`
         });
 
-        refreshSection();
-
         // Complete screening
         if (processed >= total) {
             clearInterval(screeningInterval);
@@ -177,8 +176,6 @@ function handleStartScreening() {
                 hits: mockHits,
                 statusMessage: `Screening complete. ${mockHits.length} hits found.`
             });
-
-            refreshSection();
         }
     }, 400);
 }
@@ -202,8 +199,6 @@ function handleCancelScreening() {
         },
         statusMessage: 'Screening cancelled'
     });
-
-    refreshSection();
 }
 
 /**
@@ -216,7 +211,7 @@ function generateMockHits(count) {
         hits.push({
             id: `ZINC${Math.floor(Math.random() * 90000000 + 10000000)}`,
             score: (Math.random() * 3 - 10).toFixed(2), // Negative docking scores
-            confidence: ['High', 'High', 'Medium', 'Medium', 'Low'][Math.floor(Math.random() * 5)],
+            confidence: HIT_CONFIDENCES[Math.floor(Math.random() * HIT_CONFIDENCES.length)],
             pose: null // Would contain ligand pose data
         });
     }
@@ -60,7 +60,17 @@ const TargetState = {
   showConfirmDialog: false
 };
 
-let state = { ...TargetState };
+// Fresh module state; containers are re-created so job records are not
+// accumulated on the shared TargetState template across resets
+function createTargetState() {
+  return { ...TargetState, jobHistory: [] };
+}
+
+let state = createTargetState();
+
+// Predicted structures keyed by clean sequence; outlives target resets so
+// re-submitting a sequence skips the ESMFold stage entirely
+const predictionCache = new Map();
 
 // ============================================
 // FASTA VALIDATION
@@ -68,6 +78,7 @@ let state = { ...TargetState };
 
 const AMINO_ACIDS = new Set('ACDEFGHIKLMNPQRSTVWY'.split(''));
 const EXTENDED_AMINO_ACIDS = new Set('ACDEFGHIKLMNPQRSTVWYBXZJUO'.split(''));
+const STANDARD_SEQUENCE = /^[ACDEFGHIKLMNPQRSTVWY]*$/;
 const MIN_SEQUENCE_LENGTH = 20;
 const MAX_SEQUENCE_LENGTH = 2500;
 
@@ -102,28 +113,27 @@ function validateFasta(input) {
   const sequenceLines = lines.slice(lines[0].startsWith('>') ? 1 : 0);
   const rawSequence = sequenceLines.join('').toUpperCase().replace(/\s/g, '');
 
-  // Check for invalid characters
-  const invalidChars = new Set();
-  for (const char of rawSequence) {
-    if (!EXTENDED_AMINO_ACIDS.has(char)) {
-      invalidChars.add(char);
+  // Check for invalid characters and ambiguous residues; a sequence of
+  // standard residues passes the regex and skips the per-character scan
+  if (!STANDARD_SEQUENCE.test(rawSequence)) {
+    const invalidChars = new Set();
+    const ambiguousChars = new Set();
+    for (const char of rawSequence) {
+      if (!EXTENDED_AMINO_ACIDS.has(char)) {
+        invalidChars.add(char);
+      } else if (!AMINO_ACIDS.has(char)) {
+        ambiguousChars.add(char);
+      }
     }
-  }
 
-  if (invalidChars.size > 0) {
-    result.errors.push(`Invalid characters: ${[...invalidChars].join(', ')}`);
-  }
+    if (invalidChars.size > 0) {
+      result.errors.push(`Invalid characters: ${[...invalidChars].join(', ')}`);
+    }
 
-  // Check for ambiguous residues
-  const ambiguousChars = [];
-  for (const char of rawSequence) {
-    if (EXTENDED_AMINO_ACIDS.has(char) && !AMINO_ACIDS.has(char)) {
-      ambiguousChars.push(char);
+    if (ambiguousChars.size > 0) {
+      result.warnings.push(`Ambiguous residues detected: ${[...ambiguousChars].join(', ')}`);
     }
   }
-  if (ambiguousChars.length > 0) {
-    result.warnings.push(`Ambiguous residues detected: ${[...new Set(ambiguousChars)].join(', ')}`);
-  }
 
   result.cleanSequence = rawSequence;
   result.sequenceLength = rawSequence.length;
@@ -246,7 +256,7 @@ function updateState() {
 }
 
 function resetTargetState() {
-  state = { ...TargetState };
+  state = createTargetState();
   clearViewer();
   setState({
     target: null,
@@ -807,12 +817,14 @@ async function handleLoadStructure() {
     // Actually load the structure
     const name = state.fileName.replace(/\.(pdb|cif|mmcif)$/i, '');
     const proteinInfo = await loadProteinStructure(state.selectedFile, name);
+    const checksum = await generateChecksum(state.selectedFile);
 
     // Set structure data
     state.structureData = {
       ...proteinInfo,
       source: 'File Upload',
-      resolution: 'Experimental'
+      resolution: 'Experimental',
+      structureHash: checksum
     };
 
     // Run validation
@@ -828,7 +840,7 @@ async function handleLoadStructure() {
       originalFilename: state.fileName,
       timestamp: new Date().toISOString(),
       sessionId: `SES-${Date.now().toString(36).toUpperCase()}`,
-      checksum: await generateChecksum(state.selectedFile)
+      checksum: checksum || 'Unavailable (requires secure context)'
     };
 
     state.structureStatus = 'ready';
@@ -857,31 +869,41 @@ async function handleGenerateStructure() {
   state.structureStatus = 'loading';
   updateState();
 
+  const sequence = state.fastaValidation.cleanSequence;
+  const cached = predictionCache.get(sequence);
+
   try {
-    // Simulate ESMFold prediction stages
-    await simulateProgress(job, [
-      { progress: 10, message: 'Submitting sequence to ESMFold...' },
-      { progress: 25, message: 'Encoding sequence features...' },
-      { progress: 40, message: 'Running transformer attention...' },
-      { progress: 60, message: 'Predicting 3D coordinates...' },
-      { progress: 80, message: 'Refining structure...' },
-      { progress: 95, message: 'Validating prediction...' }
-    ], 500);
+    // Simulate ESMFold prediction stages (skipped for a known sequence)
+    if (!cached) {
+      await simulateProgress(job, [
+        { progress: 10, message: 'Submitting sequence to ESMFold...' },
+        { progress: 25, message: 'Encoding sequence features...' },
+        { progress: 40, message: 'Running transformer attention...' },
+        { progress: 60, message: 'Predicting 3D coordinates...' },
+        { progress: 80, message: 'Refining structure...' },
+        { progress: 95, message: 'Validating prediction...' }
+      ], 500);
+    }
 
     // Generate mock structure data
     const name = state.fastaValidation.header || 'predicted_structure';
     const residueCount = state.fastaValidation.sequenceLength;
 
-    state.structureData = {
+    state.structureData = cached ? { ...cached, name } : {
       name: name,
       residueCount: residueCount,
       chainCount: 1,
       atomCount: residueCount * 8, // Approximate
       source: 'ESMFold Prediction',
       resolution: 'Predicted (pLDDT: 85.2)',
-      moleculeClass: classifyBySize(residueCount)
+      moleculeClass: classifyBySize(residueCount),
+      structureHash: await sha256Hex(new TextEncoder().encode(sequence))
     };
 
+    if (!cached) {
+      predictionCache.set(sequence, { ...state.structureData });
+    }
+
     // Run validation
     state.validationResults = generateValidationResults(state.structureData, true);
 
@@ -894,17 +916,19 @@ async function handleGenerateStructure() {
       source: `FASTA: ${name}`,
       timestamp: new Date().toISOString(),
       sessionId: `SES-${Date.now().toString(36).toUpperCase()}`,
-      sequenceHash: simpleHash(state.fastaValidation.cleanSequence)
+      sequenceHash: simpleHash(sequence)
     };
 
     state.structureStatus = 'ready';
-    completeJob(state.structureData, 'Structure predicted successfully (Simulated)');
+    completeJob(state.structureData, cached
+      ? 'Structure reused from prediction cache (Simulated)'
+      : 'Structure predicted successfully (Simulated)');
 
     // Update global app state
     setState({
       target: state.structureData,
       isTargetLoaded: true,
-      statusMessage: `Generated ${name} (${residueCount} residues) — Simulated`
+      statusMessage: `${cached ? 'Reused' : 'Generated'} ${name} (${residueCount} residues) — Simulated`
     });
 
   } catch (error) {
@@ -1069,8 +1093,16 @@ function generateValidationResults(data, isPredicted = false) {
 }
 
 async function generateChecksum(file) {
-  // Simulated checksum - in real app would use crypto.subtle.digest
-  return `${simpleHash(file.name + file.size)}...${simpleHash(Date.now().toString())}`;
+  // SHA-256 of the file contents, so identical uploads share one identity
+  return sha256Hex(await file.arrayBuffer());
+}
+
+async function sha256Hex(data) {
+  // WebCrypto is unavailable outside secure contexts; callers treat null
+  // as "no content identity" rather than substituting a weak key
+  if (!globalThis.crypto?.subtle) return null;
+  const digest = await crypto.subtle.digest('SHA-256', data);
+  return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
 }
 
 function simpleHash(str) {
@@ -59,9 +59,11 @@ export function subscribe(callback) {
 
 /**
  * Notify all subscribers of state change
+ * (one snapshot is built per change and shared by every subscriber)
  */
 function notifySubscribers() {
-    subscribers.forEach(callback => callback(getState()));
+    const snapshot = getState();
+    subscribers.forEach(callback => callback(snapshot));
 }
 
 /**